@@ -19,7 +19,9 @@ import mock
 import yaml
 
 import st2common.bootstrap.actionsregistrar as actions_registrar
+from st2common.exceptions.apivalidation import ValueValidationException
 from st2common.persistence.action import Action
+from st2common.persistence.runner import RunnerType
 import st2common.validators.api.action as action_validator
 from st2common.models.db.runner import RunnerTypeDB
 import st2tests.base as tests_base
@@ -141,3 +143,50 @@ class ActionsRegistrarTest(tests_base.DbTestCase):
             self.assertEqual(action_db.pack, 'wolfpack', 'Content pack must be ' +
                              'set to wolfpack')
             Action.delete(action_db)
+
+    @mock.patch.object(action_validator, '_is_valid_pack', mock.MagicMock(return_value=True))
+    def test_register_actions_from_pack_retrieves_runner_types_once(self):
+        loader = fixtures_loader.FixturesLoader()
+        loader.save_fixtures_to_db(fixtures_pack='generic',
+                                   fixtures_dict={'runners': ['testrunner1.yaml',
+                                                              'testrunner2.yaml']})
+        action_files = [loader.get_fixture_file_path_abs('generic', 'actions', action_file)
+                        for action_file in ['action1.yaml', 'action2.yaml', 'a1.yaml', 'a2.yaml']]
+
+        get_all = mock.Mock(wraps=RunnerType.get_all)
+        get_runnertype_by_name = mock.Mock(wraps=action_validator.get_runnertype_by_name)
+
+        registrar = actions_registrar.ActionsRegistrar(fail_on_failure=True)
+
+        with mock.patch.object(RunnerType, 'get_all', get_all), \
+                mock.patch.object(action_validator, 'get_runnertype_by_name',
+                                  get_runnertype_by_name):
+            registered_count = registrar._register_actions_from_pack('wolfpack', action_files)
+
+        self.assertEqual(registered_count, 4)
+
+        # Runner types are retrieved using a single query and not per action
+        self.assertEqual(get_all.call_count, 1)
+        self.assertEqual(get_runnertype_by_name.call_count, 0)
+
+        self.assertEqual(Action.get_by_name('action-1').runner_type['name'], 'test-runner-1')
+        self.assertEqual(Action.get_by_name('a2').runner_type['name'], 'test-runner-2')
+
+        for action_name in ['action-1', 'action-2', 'a1', 'a2']:
+            Action.delete(Action.get_by_name(action_name))
+
+    @mock.patch.object(action_validator, '_is_valid_pack', mock.MagicMock(return_value=True))
+    def test_register_actions_from_pack_unknown_runner_type(self):
+        loader = fixtures_loader.FixturesLoader()
+        action_file = loader.get_fixture_file_path_abs(
+            'generic', 'actions', 'action-invalid-runner.yaml')
+
+        registrar = actions_registrar.ActionsRegistrar(fail_on_failure=True)
+
+        expected_msg = 'RunnerType test-failingrunner-1 is not found.'
+        self.assertRaisesRegexp(ValueError, expected_msg,
+                                registrar._register_actions_from_pack, 'wolfpack', [action_file])
+
+        # Same error as when the runner type is not pre-fetched
+        self.assertRaisesRegexp(ValueValidationException, expected_msg,
+                                registrar._register_action, 'wolfpack', action_file)
@@ -86,6 +86,11 @@ class ResourceController(object):
     # Default kwargs passed to "APIClass.from_model" method
     from_model_kwargs = {}
 
+    # True to retrieve raw pymongo documents in "_get_all" and build API objects using
+    # "APIClass.from_dict" instead of "APIClass.from_model". This avoids instantiating a
+    # mongoengine document for each returned object.
+    get_all_as_dicts = False
+
     # Maximum value of limit which can be specified by user
     @property
     def max_limit(self):
@@ -187,8 +192,11 @@ class ResourceController(object):
                    'You need to provide either one or another, but not both.')
             raise ValueError(msg)
 
+        # Note: Raw documents are not used with include_fields since as_pymongo() omits "_id"
+        # and nested fields which are not explicitly included
+        as_dicts = self.get_all_as_dicts and not include_fields
         instances = self.access.query(exclude_fields=exclude_fields, only_fields=include_fields,
-                                      **filters)
+                                      as_pymongo=as_dicts, **filters)
         if limit == 1:
             # Perform the filtering on the DB side
             instances = instances.limit(limit)
@@ -196,9 +204,14 @@ class ResourceController(object):
         from_model_kwargs = from_model_kwargs or {}
         from_model_kwargs.update(self.from_model_kwargs)
 
+        if as_dicts:
+            from_model_method = self.model.from_dict
+        else:
+            from_model_method = self.model.from_model
+
         result = []
         for instance in instances[offset:eop]:
-            item = self.model.from_model(instance, **from_model_kwargs)
+            item = from_model_method(instance, **from_model_kwargs)
             result.append(item)
 
         resp = Response(json=result)
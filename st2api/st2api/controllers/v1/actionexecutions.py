@@ -72,6 +72,13 @@ SUPPORTED_EXECUTIONS_FILTERS.update({
     'timestamp_lt': 'start_timestamp.lt'
 })
 
+# Attributes which are always retrieved when ?include_attributes filter is used. They are needed to
+# determine which parameters are secret and need to be masked.
+INCLUDE_ATTRIBUTES_ALWAYS = [
+    'action',
+    'runner'
+]
+
 MONITOR_THREAD_EMPTY_Q_SLEEP_TIME = 5
 MONITOR_THREAD_NO_WORKERS_SLEEP_TIME = 1
 
@@ -511,12 +518,21 @@ class ActionExecutionsController(ActionExecutionsControllerMixin, ResourceContro
 
         Handles requests:
             GET /executions[?exclude_attributes=result,trigger_instance]
+            GET /executions[?include_attributes=status,start_timestamp]
 
         :param exclude_attributes: List of attributes to exclude from the object.
         :type exclude_attributes: ``list``
+
+        :param include_attributes: List of attributes to include in the object.
+        :type include_attributes: ``list``
         """
         exclude_fields = self._validate_exclude_fields(exclude_fields=exclude_attributes)
 
+        if include_attributes:
+            # Those attributes are always needed to correctly mask secret parameters
+            include_attributes = include_attributes + [attr for attr in INCLUDE_ATTRIBUTES_ALWAYS
+                                                       if attr not in include_attributes]
+
         # Use a custom sort order when filtering on a timestamp so we return a correct result as
         # expected by the user
         query_options = None
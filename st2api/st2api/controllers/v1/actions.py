@@ -74,6 +74,9 @@ class ActionsController(resource.ContentPackResourceController):
 
     include_reference = True
 
+    # Retrieve raw documents and avoid mongoengine document instantiation for each action
+    get_all_as_dicts = True
+
     def __init__(self, *args, **kwargs):
         super(ActionsController, self).__init__(*args, **kwargs)
         self._trigger_dispatcher = TriggerDispatcher(LOG)
@@ -148,7 +151,10 @@ class ActionsController(resource.ContentPackResourceController):
         return Response(json=action_api, status=http_client.CREATED)
 
     def put(self, action, ref_or_id, requester_user):
-        action_db = self._get_by_ref_or_id(ref_or_id=ref_or_id)
+        # Note: Existing action object is replaced with the new one so we only retrieve
+        # attributes which are needed for the permission check (uid) and the default pack
+        action_db = self._get_by_ref_or_id(ref_or_id=ref_or_id,
+                                           include_fields=['id', 'pack', 'name'])
 
         # Assert permissions
         permission_type = PermissionType.ACTION_MODIFY
@@ -27,6 +27,7 @@ import mock
 import unittest2
 from six.moves import http_client
 
+from st2common.models.api.action import ActionAPI
 from st2common.persistence.action import Action
 import st2common.validators.api.action as action_validator
 from st2common.constants.pack import SYSTEM_PACK_NAME
@@ -400,6 +401,12 @@ class TestActionController(FunctionalTest, CleanFilesTestCase):
         self.assertFalse(resp.json[0]['entry_point'])
         self.assertFalse(resp.json[1]['entry_point'])
 
+        # Id and runner type are always returned
+        self.assertEqual(sorted([item['id'] for item in resp.json]),
+                         sorted([action_1_id, action_2_id]))
+        self.assertEqual(resp.json[0]['runner_type'], 'local-shell-script')
+        self.assertEqual(resp.json[1]['runner_type'], 'local-shell-script')
+
         # Valid include attribute
         resp = self.app.get('/v1/actions?include_attributes=entry_point')
         self.assertEqual(resp.status_int, 200)
@@ -410,6 +417,35 @@ class TestActionController(FunctionalTest, CleanFilesTestCase):
         self.__do_delete(action_1_id)
         self.__do_delete(action_2_id)
 
+    @mock.patch.object(action_validator, 'validate_action', mock.MagicMock(
+        return_value=True))
+    def test_get_all_raw_documents_not_used_with_include_attributes(self):
+        action_1_id = self.__get_action_id(self.__do_post(ACTION_1))
+        action_2_id = self.__get_action_id(self.__do_post(ACTION_2))
+
+        from_dict = mock.Mock(wraps=ActionAPI.from_dict)
+        from_model = mock.Mock(wraps=ActionAPI.from_model)
+
+        with mock.patch.object(ActionAPI, 'from_dict', from_dict), \
+                mock.patch.object(ActionAPI, 'from_model', from_model):
+            resp = self.app.get('/v1/actions')
+            self.assertEqual(resp.status_int, 200)
+            self.assertEqual(from_dict.call_count, 2)
+            self.assertEqual(from_model.call_count, 0)
+
+            from_dict.reset_mock()
+
+            # as_pymongo() omits "_id" for .only() queries so mongoengine documents are used
+            resp = self.app.get('/v1/actions?include_attributes=name')
+            self.assertEqual(resp.status_int, 200)
+            self.assertEqual(from_dict.call_count, 0)
+            self.assertEqual(from_model.call_count, 2)
+            self.assertEqual(sorted([item['id'] for item in resp.json]),
+                             sorted([action_1_id, action_2_id]))
+
+        self.__do_delete(action_1_id)
+        self.__do_delete(action_2_id)
+
     @mock.patch.object(action_validator, 'validate_action', mock.MagicMock(
         return_value=True))
     def test_query(self):
@@ -567,6 +603,27 @@ class TestActionController(FunctionalTest, CleanFilesTestCase):
         delete_resp = self.__do_delete(self.__get_action_id(post_resp))
         self.assertEqual(delete_resp.status_int, 204)
 
+    @mock.patch.object(action_validator, 'validate_action', mock.MagicMock(
+        return_value=True))
+    def test_put_by_ref(self):
+        action = copy.copy(ACTION_1)
+        post_resp = self.__do_post(action)
+        self.assertEqual(post_resp.status_int, 201)
+
+        ref = '%s.%s' % (action['pack'], action['name'])
+        action['description'] = 'some other test description'
+        del action['pack']
+        put_resp = self.__do_put(ref, action)
+        self.assertEqual(put_resp.status_int, 200)
+        self.assertEqual(put_resp.json['id'], post_resp.json['id'])
+        self.assertEqual(put_resp.json['pack'], ACTION_1['pack'])
+        self.assertEqual(put_resp.json['description'], action['description'])
+
+        put_resp = self.__do_put('wolfpack.doesntexist', action, expect_errors=True)
+        self.assertEqual(put_resp.status_int, 404)
+
+        self.__do_delete(self.__get_action_id(post_resp))
+
     def test_post_invalid_runner_type(self):
         post_resp = self.__do_post(ACTION_5, expect_errors=True)
         self.assertEqual(post_resp.status_int, 400)
@@ -344,6 +344,40 @@ class ActionExecutionControllerTestCase(BaseActionExecutionControllerTestCase, F
             if 'end_timestamp' in body[i]:
                 self.assertTrue('elapsed_seconds' in body[i])
 
+    def test_get_all_include_attributes(self):
+        # Note: Other tests in this class also create executions so we only look at the ones we
+        # created here
+        actionexecution_1_id = self._get_actionexecution_id(self._do_post(LIVE_ACTION_1))
+        actionexecution_2_id = self._get_actionexecution_id(self._do_post(LIVE_ACTION_2))
+
+        resp = self.app.get('/v1/executions?include_attributes=status,start_timestamp')
+        self.assertEqual(resp.status_int, 200)
+
+        executions = dict([(item['id'], item) for item in resp.json])
+        self.assertTrue(set([actionexecution_1_id, actionexecution_2_id]).issubset(executions))
+
+        for execution_id in [actionexecution_1_id, actionexecution_2_id]:
+            execution = executions[execution_id]
+            self.assertTrue('status' in execution)
+            self.assertTrue('start_timestamp' in execution)
+            self.assertFalse('result' in execution)
+            self.assertFalse('liveaction' in execution)
+            self.assertFalse('parameters' in execution)
+
+        # Attributes which are needed to mask secret parameters are always included
+        resp = self.app.get('/v1/executions?action=%s&include_attributes=parameters' %
+                            (LIVE_ACTION_1['action']))
+        self.assertEqual(resp.status_int, 200)
+
+        executions = dict([(item['id'], item) for item in resp.json])
+        self.assertTrue(actionexecution_1_id in executions)
+        self.assertFalse(actionexecution_2_id in executions)
+
+        execution = executions[actionexecution_1_id]
+        self.assertTrue('action' in execution)
+        self.assertTrue('runner' in execution)
+        self.assertEqual(execution['parameters']['d'], MASKED_ATTRIBUTE_VALUE)
+
     def test_get_all_invalid_offset_too_large(self):
         resp = self.app.get('/v1/executions?offset=2147483648&limit=1', expect_errors=True)
         self.assertEqual(resp.status_int, 400)
@@ -17,6 +17,7 @@ from __future__ import absolute_import
 
 import os
 import ast
+import stat
 import copy
 import json
 import logging
@@ -28,8 +29,6 @@ import sys
 
 from os.path import join as pjoin
 
-from six.moves import range
-
 from st2client import models
 from st2client.commands import resource
 from st2client.commands.resource import ResourceNotFoundError
@@ -112,11 +111,102 @@ def format_parameters(value):
     return value
 
 
+def transform_object(value):
+    # Also support simple key1=val1,key2=val2 syntax
+    if value.startswith('{'):
+        # Assume it's JSON
+        result = value = json.loads(value)
+    else:
+        pairs = value.split(',')
+
+        result = {}
+        for pair in pairs:
+            split = pair.split('=', 1)
+
+            if len(split) != 2:
+                continue
+
+            key, value = split
+            result[key] = value
+    return result
+
+
+def transform_array(value, action_params=None, auto_dict=False, runner_params=None):
+    action_params = action_params or {}
+    runner_params = runner_params or {}
+
+    # Sometimes an array parameter only has a single element:
+    #
+    #     i.e. "st2 run foopack.fooaction arrayparam=51"
+    #
+    # Normally, json.loads would throw an exception, and the split method
+    # would be used. However, since this is an int, not only would
+    # splitting not work, but json.loads actually treats this as valid JSON,
+    # but as an int, not an array. This causes a mismatch when the API is called.
+    #
+    # We want to try to handle this first, so it doesn't get accidentally
+    # sent to the API as an int, instead of an array of single-element int.
+    try:
+        # Force this to be a list containing the single int, then
+        # cast the whole thing to string so json.loads can handle it
+        value = str([int(value)])
+    except ValueError:
+        # Original value wasn't an int, so just let it continue
+        pass
+
+    # At this point, the input is either a a "json.loads"-able construct
+    # like [1, 2, 3], or even [1], or it is a comma-separated list,
+    # Try both, in that order.
+    try:
+        result = json.loads(value)
+    except ValueError:
+        result = [v.strip() for v in value.split(',')]
+
+    # When each values in this array represent dict type, this converts
+    # the 'result' to the dict type value.
+    if all([isinstance(x, str) and ':' in x for x in result]) and auto_dict:
+        result_dict = {}
+        for (k, v) in [x.split(':') for x in result]:
+            # To parse values using the 'transformer' according to the type which is
+            # specified in the action metadata, calling 'normalize' method recursively.
+            if 'properties' in action_params and k in action_params['properties']:
+                result_dict[k] = ActionRunCommandMixin._normalize(
+                    runner_params=runner_params, action_params=action_params['properties'],
+                    name=k, value=v, auto_dict=auto_dict)
+            else:
+                result_dict[k] = v
+        return [result_dict]
+
+    return result
+
+
+def transform_boolean(value):
+    return ast.literal_eval(value.capitalize())
+
+
+# Maps action parameter type to a function which casts a CLI argument value to that type
+PARAMETER_TYPE_TRANSFORMERS = {
+    'array': transform_array,
+    'boolean': transform_boolean,
+    'integer': int,
+    'number': float,
+    'object': transform_object,
+    'string': str
+}
+
+
 # String for indenting etc.
 WF_PREFIX = '+ '
 NON_WF_PREFIX = '  '
 INDENT_CHAR = ' '
 
+# Text wrappers used when printing action parameters help. They are created once and re-used
+# since instantiating a TextWrapper for each printed parameter is wasteful.
+PARAM_NAME_WRAPPER = textwrap.TextWrapper(width=78, initial_indent=' ' * 4,
+                                          subsequent_indent=' ' * 4)
+PARAM_ATTRIBUTE_WRAPPER = textwrap.TextWrapper(width=78, initial_indent=' ' * 8,
+                                               subsequent_indent=' ' * 8)
+
 
 def format_wf_instances(instances):
     """
@@ -248,7 +338,16 @@ class ActionRunCommandMixin(object):
         'status': format_status
     }
 
-    poll_interval = 2  # how often to poll for execution completion when using sync mode
+    # How often to poll for execution completion when using sync mode. We start with
+    # "min_poll_interval" and back off exponentially up to "poll_interval" seconds so short
+    # running actions return quickly and long running ones don't result in many API requests.
+    min_poll_interval = 0.1
+    poll_interval = 2
+    poll_interval_backoff_factor = 1.5
+
+    # Minimum number of seconds between flushing the progress dots printed while polling to
+    # stdout. This way we don't issue a write for every poll when polling with short intervals.
+    progress_flush_interval = 1
 
     def get_resource(self, ref_or_id, **kwargs):
         return self.get_resource_by_ref_or_id(ref_or_id=ref_or_id, **kwargs)
@@ -455,11 +554,20 @@ class ActionRunCommandMixin(object):
             return execution
 
         if not args.async:
+            poll_interval = self.min_poll_interval
+            unflushed_seconds = 0
+
             while execution.status in pending_statuses:
-                time.sleep(self.poll_interval)
+                time.sleep(poll_interval)
+                unflushed_seconds += poll_interval
+                poll_interval = min(poll_interval * self.poll_interval_backoff_factor,
+                                    self.poll_interval)
                 if not args.json and not args.yaml:
                     sys.stdout.write('.')
-                    sys.stdout.flush()
+
+                    if unflushed_seconds >= self.progress_flush_interval:
+                        sys.stdout.flush()
+                        unflushed_seconds = 0
                 execution = action_exec_mgr.get_by_id(execution.id, **kwargs)
 
             sys.stdout.write('\n')
@@ -523,13 +631,24 @@ class ActionRunCommandMixin(object):
 
         :rtype: ``dict``
         """
+        result = {}
+
+        if not args.parameters:
+            return result
+
         action_ref_or_id = action.ref
+        runner_params = runner.runner_parameters
+        action_params = action.parameters
 
         def read_file(file_path):
-            if not os.path.exists(file_path):
+            # Note: We use a single stat() call instead of separate os.path.exists and
+            # os.path.isfile calls
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
                 raise ValueError('File "%s" doesn\'t exist' % (file_path))
 
-            if not os.path.isfile(file_path):
+            if not stat.S_ISREG(file_stat.st_mode):
                 raise ValueError('"%s" is not a file' % (file_path))
 
             with open(file_path, 'rb') as fp:
@@ -537,168 +656,48 @@ class ActionRunCommandMixin(object):
 
             return content
 
-        def transform_object(value):
-            # Also support simple key1=val1,key2=val2 syntax
-            if value.startswith('{'):
-                # Assume it's JSON
-                result = value = json.loads(value)
-            else:
-                pairs = value.split(',')
-
-                result = {}
-                for pair in pairs:
-                    split = pair.split('=', 1)
-
-                    if len(split) != 2:
-                        continue
-
-                    key, value = split
-                    result[key] = value
-            return result
+        params, cmd = self._split_parameters_args(parameters=args.parameters)
 
-        def transform_array(value, action_params=None, auto_dict=False):
-            action_params = action_params or {}
-
-            # Sometimes an array parameter only has a single element:
-            #
-            #     i.e. "st2 run foopack.fooaction arrayparam=51"
-            #
-            # Normally, json.loads would throw an exception, and the split method
-            # would be used. However, since this is an int, not only would
-            # splitting not work, but json.loads actually treats this as valid JSON,
-            # but as an int, not an array. This causes a mismatch when the API is called.
-            #
-            # We want to try to handle this first, so it doesn't get accidentally
-            # sent to the API as an int, instead of an array of single-element int.
-            try:
-                # Force this to be a list containing the single int, then
-                # cast the whole thing to string so json.loads can handle it
-                value = str([int(value)])
-            except ValueError:
-                # Original value wasn't an int, so just let it continue
-                pass
-
-            # At this point, the input is either a a "json.loads"-able construct
-            # like [1, 2, 3], or even [1], or it is a comma-separated list,
-            # Try both, in that order.
+        for k, v, is_file in params:
             try:
-                result = json.loads(value)
-            except ValueError:
-                result = [v.strip() for v in value.split(',')]
-
-            # When each values in this array represent dict type, this converts
-            # the 'result' to the dict type value.
-            if all([isinstance(x, str) and ':' in x for x in result]) and auto_dict:
-                result_dict = {}
-                for (k, v) in [x.split(':') for x in result]:
-                    # To parse values using the 'transformer' according to the type which is
-                    # specified in the action metadata, calling 'normalize' method recursively.
-                    if 'properties' in action_params and k in action_params['properties']:
-                        result_dict[k] = normalize(k, v, action_params['properties'],
-                                                   auto_dict=auto_dict)
+                if is_file:
+                    # Files are handled a bit differently since we ship the content
+                    # over the wire
+                    file_path = os.path.normpath(pjoin(os.getcwd(), v))
+                    file_name = os.path.basename(file_path)
+                    content = read_file(file_path=file_path)
+
+                    if action_ref_or_id == 'core.http':
+                        # Special case for http runner
+                        result['_file_name'] = file_name
+                        result['file_content'] = content
                     else:
-                        result_dict[k] = v
-                return [result_dict]
-
-            return result
-
-        transformer = {
-            'array': transform_array,
-            'boolean': (lambda x: ast.literal_eval(x.capitalize())),
-            'integer': int,
-            'number': float,
-            'object': transform_object,
-            'string': str
-        }
-
-        def get_param_type(key, action_params=None):
-            action_params = action_params or action.parameters
-
-            param = None
-            if key in runner.runner_parameters:
-                param = runner.runner_parameters[key]
-            elif key in action_params:
-                param = action_params[key]
-
-            if param:
-                return param['type']
-
-            return None
-
-        def normalize(name, value, action_params=None, auto_dict=False):
-            """ The desired type is contained in the action meta-data, so we can look that up
-                and call the desired "caster" function listed in the "transformer" dict
-            """
-            action_params = action_params or action.parameters
-
-            # By default, this method uses a parameter which is defined in the action metadata.
-            # This method assume to be called recursively for parsing values in an array of objects
-            # type value according to the nested action metadata definition.
-            #
-            # This is a best practice to pass a list value as default argument to prevent
-            # unforeseen consequence by being created a persistent object.
-
-            # Users can also specify type for each array parameter inside an action metadata
-            # (items: type: int for example) and this information is available here so we could
-            # also leverage that to cast each array item to the correct type.
-            param_type = get_param_type(name, action_params)
-            if param_type == 'array' and name in action_params:
-                return transformer[param_type](value, action_params[name], auto_dict=auto_dict)
-            elif param_type:
-                return transformer[param_type](value)
-
-            return value
-
-        result = {}
-
-        if not args.parameters:
-            return result
-
-        for idx in range(len(args.parameters)):
-            arg = args.parameters[idx]
-            if '=' in arg:
-                k, v = arg.split('=', 1)
-
-                # Attribute for files are prefixed with "@"
-                if k.startswith('@'):
-                    k = k[1:]
-                    is_file = True
+                        result[k] = content
                 else:
-                    is_file = False
-
-                try:
-                    if is_file:
-                        # Files are handled a bit differently since we ship the content
-                        # over the wire
-                        file_path = os.path.normpath(pjoin(os.getcwd(), v))
-                        file_name = os.path.basename(file_path)
-                        content = read_file(file_path=file_path)
-
-                        if action_ref_or_id == 'core.http':
-                            # Special case for http runner
-                            result['_file_name'] = file_name
-                            result['file_content'] = content
-                        else:
-                            result[k] = content
+                    # This permits multiple declarations of argument only in the array type.
+                    param_type = self._get_param_type(runner_params=runner_params,
+                                                      action_params=action_params, name=k)
+                    value = self._normalize(runner_params=runner_params,
+                                            action_params=action_params, name=k, value=v,
+                                            auto_dict=args.auto_dict)
+
+                    if param_type == 'array' and k in result:
+                        result[k] += value
                     else:
-                        # This permits multiple declarations of argument only in the array type.
-                        if get_param_type(k) == 'array' and k in result:
-                            result[k] += normalize(k, v, auto_dict=args.auto_dict)
-                        else:
-                            result[k] = normalize(k, v, auto_dict=args.auto_dict)
+                        result[k] = value
+
+            except Exception as e:
+                # TODO: Move transformers in a separate module and handle
+                # exceptions there
+                if 'malformed string' in str(e):
+                    message = ('Invalid value for boolean parameter. '
+                               'Valid values are: true, false')
+                    raise ValueError(message)
+                else:
+                    raise e
 
-                except Exception as e:
-                    # TODO: Move transformers in a separate module and handle
-                    # exceptions there
-                    if 'malformed string' in str(e):
-                        message = ('Invalid value for boolean parameter. '
-                                   'Valid values are: true, false')
-                        raise ValueError(message)
-                    else:
-                        raise e
-            else:
-                result['cmd'] = ' '.join(args.parameters[idx:])
-                break
+        if cmd is not None:
+            result['cmd'] = cmd
 
         # Special case for http runner
         if 'file_content' in result:
@@ -717,6 +716,76 @@ class ActionRunCommandMixin(object):
 
         return result
 
+    @staticmethod
+    def _split_parameters_args(parameters):
+        """
+        Split CLI parameter arguments into a list of (name, value, is_file) tuples and a
+        positional "cmd" argument string.
+
+        The first argument which is not in the name=value format and all the arguments which
+        follow it are treated as positional arguments.
+
+        :type parameters: ``list``
+
+        :rtype: ``tuple`` (``list``, ``str``)
+        """
+        params = []
+        cmd = None
+
+        for idx, arg in enumerate(parameters):
+            separator_idx = arg.find('=')
+
+            if separator_idx == -1:
+                cmd = ' '.join(parameters[idx:])
+                break
+
+            name, value = arg[:separator_idx], arg[separator_idx + 1:]
+
+            # Attribute for files are prefixed with "@"
+            if name.startswith('@'):
+                params.append((name[1:], value, True))
+            else:
+                params.append((name, value, False))
+
+        return params, cmd
+
+    @staticmethod
+    def _get_param_type(runner_params, action_params, name):
+        """
+        Return type of the provided parameter. Runner parameter definition takes precedence over
+        the action one.
+        """
+        param = None
+        if name in runner_params:
+            param = runner_params[name]
+        elif name in action_params:
+            param = action_params[name]
+
+        if param:
+            return param['type']
+
+        return None
+
+    @staticmethod
+    def _normalize(runner_params, action_params, name, value, auto_dict=False):
+        """
+        The desired type is contained in the action meta-data, so we can look that up and call
+        the desired "caster" function listed in the "PARAMETER_TYPE_TRANSFORMERS" dict.
+        """
+        # Users can also specify type for each array parameter inside an action metadata
+        # (items: type: int for example) and this information is available here so we could
+        # also leverage that to cast each array item to the correct type.
+        param_type = ActionRunCommandMixin._get_param_type(runner_params=runner_params,
+                                                           action_params=action_params,
+                                                           name=name)
+        if param_type == 'array' and name in action_params:
+            return transform_array(value, action_params[name], auto_dict=auto_dict,
+                                   runner_params=runner_params)
+        elif param_type:
+            return PARAMETER_TYPE_TRANSFORMERS[param_type](value)
+
+        return value
+
     @add_auth_token_to_kwargs_from_cli
     def _print_help(self, args, **kwargs):
         # Print appropriate help message if the help option is given.
@@ -773,12 +842,8 @@ class ActionRunCommandMixin(object):
         if not schema:
             raise ValueError('Missing schema for parameter "%s"' % (name))
 
-        wrapper = textwrap.TextWrapper(width=78)
-        wrapper.initial_indent = ' ' * 4
-        wrapper.subsequent_indent = wrapper.initial_indent
-        print(wrapper.fill(name))
-        wrapper.initial_indent = ' ' * 8
-        wrapper.subsequent_indent = wrapper.initial_indent
+        print(PARAM_NAME_WRAPPER.fill(name))
+        wrapper = PARAM_ATTRIBUTE_WRAPPER
         if 'description' in schema and schema['description']:
             print(wrapper.fill(schema['description']))
         if 'type' in schema and schema['type']:
@@ -793,25 +858,16 @@ class ActionRunCommandMixin(object):
     def _get_params_types(runner, action):
         runner_params = runner.runner_parameters
         action_params = action.parameters
-        parameters = copy.copy(runner_params)
-        parameters.update(copy.copy(action_params))
-        required = set([k for k, v in six.iteritems(parameters) if v.get('required')])
-
-        def is_immutable(runner_param_meta, action_param_meta):
-            # If runner sets a param as immutable, action cannot override that.
-            if runner_param_meta.get('immutable', False):
-                return True
-            else:
-                return action_param_meta.get('immutable', False)
 
-        immutable = set()
-        for param in parameters.keys():
-            if is_immutable(runner_params.get(param, {}),
-                            action_params.get(param, {})):
-                immutable.add(param)
+        # Note: Action parameter definition overrides the runner one
+        parameters = dict(runner_params)
+        parameters.update(action_params)
 
-        required = required - immutable
-        optional = set(parameters.keys()) - required - immutable
+        # If runner sets a param as immutable, action cannot override that
+        immutable = {k for k, v in six.iteritems(runner_params) if v.get('immutable', False)}
+        immutable.update(k for k, v in six.iteritems(action_params) if v.get('immutable', False))
+        required = {k for k, v in six.iteritems(parameters) if v.get('required')} - immutable
+        optional = set(parameters) - required - immutable
 
         return parameters, required, optional, immutable
 
@@ -871,35 +927,33 @@ class ActionRunCommandMixin(object):
             'end_timestamp': getattr(task, 'end_timestamp', None)
         })
 
-    def _sort_parameters(self, parameters, names):
+    @staticmethod
+    def _sort_parameters(parameters, names):
         """
         Sort a provided list of action parameters.
 
-        :type parameters: ``list``
-        :type names: ``list`` or ``set``
-        """
-        sorted_parameters = sorted(names, key=lambda name:
-                                   self._get_parameter_sort_value(
-                                       parameters=parameters,
-                                       name=name))
-
-        return sorted_parameters
+        Parameters are sorted using "position" parameter attribute. If this attribute is not
+        available, parameter is sorted after the positional ones based on the name. Parameters
+        which are not available in the provided schema are sorted first.
 
-    def _get_parameter_sort_value(self, parameters, name):
+        :type parameters: ``dict``
+        :type names: ``list`` or ``set``
         """
-        Return a value which determines sort order for a particular parameter.
+        sort_values = []
+        for name in names:
+            parameter = parameters.get(name, None)
+
+            if not parameter:
+                sort_value = (0, 0, name)
+            elif 'position' in parameter:
+                sort_value = (1, parameter['position'], name)
+            else:
+                sort_value = (2, 0, name)
 
-        By default, parameters are sorted using "position" parameter attribute.
-        If this attribute is not available, parameter is sorted based on the
-        name.
-        """
-        parameter = parameters.get(name, None)
+            sort_values.append(sort_value)
 
-        if not parameter:
-            return None
-
-        sort_value = parameter.get('position', name)
-        return sort_value
+        sort_values.sort()
+        return [name for _, _, name in sort_values]
 
     def _get_inherited_env_vars(self):
         env_vars = os.environ.copy()
@@ -969,11 +1023,15 @@ class ActionRunCommand(ActionRunCommandMixin, resource.ResourceCommand):
             raise resource.ResourceNotFoundError('Action "%s" cannot be found.'
                                                  % (args.ref_or_id))
 
-        runner_mgr = self.app.client.managers['RunnerType']
-        runner = runner_mgr.get_by_name(action.runner_type, **kwargs)
-        if not runner:
-            raise resource.ResourceNotFoundError('Runner type "%s" for action "%s" cannot be \
-                                                 found.' % (action.runner_type, action.name))
+        # Note: Runner type is only needed to parse parameters provided on the command line so we
+        # avoid additional API request if no parameters are provided
+        runner = None
+        if args.parameters:
+            runner_mgr = self.app.client.managers['RunnerType']
+            runner = runner_mgr.get_by_name(action.runner_type, **kwargs)
+            if not runner:
+                raise resource.ResourceNotFoundError('Runner type "%s" for action "%s" cannot be \
+                                                     found.' % (action.runner_type, action.name))
 
         action_ref = '.'.join([action.pack, action.name])
         action_parameters = self._get_action_parameters_from_args(action=action, runner=runner,
@@ -1061,6 +1119,21 @@ class ActionExecutionReadCommand(resource.ResourceCommand):
 class ActionExecutionListCommand(ActionExecutionReadCommand):
     display_attributes = ['id', 'action.ref', 'context.user', 'status', 'start_timestamp',
                           'end_timestamp']
+
+    # Attributes which are always needed to format the output (workflow prefixes and elapsed
+    # time), even if they are not displayed
+    format_attributes = ['status', 'start_timestamp', 'end_timestamp', 'children']
+
+    # Top level execution database fields which can be retrieved using ?include_attributes filter
+    include_attributes_db_fields = ['id', 'trigger', 'trigger_type', 'trigger_instance', 'rule',
+                                    'action', 'runner', 'liveaction', 'status', 'start_timestamp',
+                                    'end_timestamp', 'parameters', 'result', 'context', 'parent',
+                                    'children', 'log', 'web_url']
+
+    # API attributes which are computed from other database fields
+    include_attributes_computed = {
+        'elapsed_seconds': ['start_timestamp', 'end_timestamp']
+    }
     attribute_transform_functions = {
         'start_timestamp': format_isodate_for_user_timezone,
         'end_timestamp': format_isodate_for_user_timezone,
@@ -1142,14 +1215,51 @@ class ActionExecutionListCommand(ActionExecutionReadCommand):
             elif args.sort_order in ['desc', 'descending']:
                 kwargs['sort_desc'] = True
 
-        # We exclude "result" and "trigger_instance" attributes which can contain a lot of data
-        # since they are not displayed nor used which speeds the common operation substantially.
-        exclude_attributes = self._get_exclude_attributes(args=args)
-        exclude_attributes = ','.join(exclude_attributes)
-        kwargs['exclude_attributes'] = exclude_attributes
+        # Only retrieve attributes which are displayed or used for formatting the output
+        include_attributes = self._get_include_attributes(args=args)
+
+        if include_attributes:
+            kwargs['include_attributes'] = ','.join(include_attributes)
+        else:
+            # We exclude "result" and "trigger_instance" attributes which can contain a lot of
+            # data since they are not displayed nor used which speeds the common operation
+            # substantially.
+            exclude_attributes = self._get_exclude_attributes(args=args)
+            kwargs['exclude_attributes'] = ','.join(exclude_attributes)
 
         return self.manager.query_with_count(limit=args.last, **kwargs)
 
+    @classmethod
+    def _get_include_attributes(cls, args):
+        """
+        Retrieve a list of top level attributes which need to be retrieved from the server for
+        particular command line arguments.
+
+        None is returned if all the attributes need to be retrieved ("all" or an unknown
+        attribute is requested).
+
+        :rtype: ``list`` or ``None``
+        """
+        include_attributes = []
+
+        for attr in args.attr + cls.format_attributes:
+            # Note: Child attribute properties (e.g. action.ref) are retrieved by including the
+            # top level attribute
+            attr = attr.split('.', 1)[0]
+
+            if attr in cls.include_attributes_computed:
+                db_fields = cls.include_attributes_computed[attr]
+            elif attr in cls.include_attributes_db_fields:
+                db_fields = [attr]
+            else:
+                return None
+
+            for db_field in db_fields:
+                if db_field not in include_attributes:
+                    include_attributes.append(db_field)
+
+        return include_attributes
+
     def run_and_print(self, args, **kwargs):
 
         result, count = self.run(args, **kwargs)
@@ -1307,7 +1417,11 @@ class ActionExecutionReRunCommand(ActionRunCommandMixin, resource.ResourceComman
 
         action_ref = existing_execution.action['ref']
         action = action_mgr.get_by_ref_or_id(action_ref)
-        runner = runner_mgr.get_by_name(action.runner_type)
+
+        # Note: Runner type is only needed to parse parameters provided on the command line
+        runner = None
+        if args.parameters:
+            runner = runner_mgr.get_by_name(action.runner_type)
 
         action_parameters = self._get_action_parameters_from_args(action=action, runner=runner,
                                                                   args=args)
@@ -16,6 +16,7 @@
 from __future__ import absolute_import
 
 import ast
+import json
 import logging
 import struct
 
@@ -51,7 +52,7 @@ class ExecutionResult(formatters.Formatter):
                 value = strutil.strip_carriage_returns(strutil.unescape(value))
                 if (isinstance(value, six.string_types) and len(value) > 0 and
                         value[0] in ['{', '['] and value[len(value) - 1] in ['}', ']']):
-                    new_value = ast.literal_eval(value)
+                    new_value = cls._parse_structured_value(value=value)
                     if type(new_value) in [dict, list]:
                         value = new_value
                 if type(value) in [dict, list]:
@@ -81,3 +82,25 @@ class ExecutionResult(formatters.Formatter):
         else:
             # Assume Python 2
             return strutil.unescape(str(output)).decode('unicode_escape').encode('utf-8')
+
+    @staticmethod
+    def _parse_structured_value(value):
+        """
+        Parse a string which looks like a serialized dictionary or a list.
+
+        Python literal representation is tried first so the existing output is preserved. JSON is
+        tried second since values serialized as JSON can contain true, false and null which are
+        not valid Python literals and would make ast.literal_eval fail. If the value can't be
+        parsed using either, it's returned as is.
+        """
+        # Note: TypeError is raised for unhashable dictionary keys (e.g. "{[1]: 2}") and
+        # MemoryError / RuntimeError (RecursionError on Python 3) for very deeply nested values
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError, TypeError, MemoryError, RuntimeError):
+            pass
+
+        try:
+            return json.loads(value)
+        except (ValueError, RuntimeError):
+            return value
@@ -64,8 +64,8 @@ class Resource(object):
     _repr_attributes = []
 
     def __init__(self, *args, **kwargs):
-        for k, v in six.iteritems(kwargs):
-            setattr(self, k, v)
+        # Note: Faster than setattr, classes with properties (e.g. KeyValuePair) override this
+        self.__dict__.update(kwargs)
 
     def to_dict(self, exclude_attributes=None):
         """
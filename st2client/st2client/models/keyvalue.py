@@ -17,6 +17,8 @@ from __future__ import absolute_import
 
 import logging
 
+import six
+
 from st2client.models import core
 
 
@@ -30,6 +32,11 @@ class KeyValuePair(core.Resource):
     _plural_display_name = 'Key Value Pairs'
     _repr_attributes = ['name', 'value']
 
+    def __init__(self, *args, **kwargs):
+        # Note: "id" is a property so attributes need to be set using setattr
+        for k, v in six.iteritems(kwargs):
+            setattr(self, k, v)
+
     # Note: This is a temporary hack until we refactor client and make it support non id PKs
 
     def get_id(self):
@@ -118,6 +118,21 @@ class ActionCommandTestCase(base.BaseCLITestCase):
         expected = {'action': 'mockety.mock1', 'user': None, 'parameters': {'bool': False}}
         httpclient.HTTPClient.post.assert_called_with('/executions', expected)
 
+    @mock.patch.object(
+        models.ResourceManager, 'get_by_ref_or_id',
+        mock.MagicMock(side_effect=get_by_ref))
+    @mock.patch.object(
+        models.ResourceManager, 'get_by_name',
+        mock.MagicMock(side_effect=get_by_name))
+    @mock.patch.object(
+        httpclient.HTTPClient, 'post',
+        mock.MagicMock(return_value=base.FakeResponse(json.dumps(LIVE_ACTION), 200, 'OK')))
+    def test_run_no_parameters_runner_type_not_retrieved(self):
+        self.shell.run(['run', 'mockety.mock1'])
+        expected = {'action': 'mockety.mock1', 'user': None, 'parameters': {}}
+        httpclient.HTTPClient.post.assert_called_with('/executions', expected)
+        self.assertEqual(models.ResourceManager.get_by_name.call_count, 0)
+
     @mock.patch.object(
         models.ResourceManager, 'get_by_ref_or_id',
         mock.MagicMock(side_effect=get_by_ref))
@@ -122,6 +122,39 @@ class TestLiveActionResourceManager(unittest2.TestCase):
 
         httpclient.HTTPClient.post.assert_called_with(endpoint, data)
 
+    @mock.patch.object(
+        models.ResourceManager, 'get_by_id',
+        mock.MagicMock(return_value=models.LiveAction(**LIVE_ACTION)))
+    @mock.patch.object(
+        models.ResourceManager, 'get_by_ref_or_id',
+        mock.MagicMock(return_value=models.Action(**ACTION)))
+    @mock.patch.object(
+        models.ResourceManager, 'get_by_name',
+        mock.MagicMock(return_value=models.RunnerType(**RUNNER)))
+    @mock.patch.object(
+        httpclient.HTTPClient, 'post',
+        mock.MagicMock(return_value=base.FakeResponse(json.dumps(LIVE_ACTION), 200, 'OK')))
+    def test_rerun_with_no_reset(self):
+        execution = self.client.liveactions.re_run(
+            LIVE_ACTION['id'],
+            tasks=['x', 'y', 'z'],
+            no_reset=['y']
+        )
+
+        self.assertEqual(execution.id, LIVE_ACTION['id'])
+
+        endpoint = '/executions/%s/re_run' % LIVE_ACTION['id']
+
+        args, _ = httpclient.HTTPClient.post.call_args
+        self.assertEqual(args[0], endpoint)
+        self.assertEqual(args[1]['tasks'], ['x', 'y', 'z'])
+        self.assertEqual(sorted(args[1]['reset']), ['x', 'z'])
+        self.assertEqual(args[1]['parameters'], {})
+
+    def test_rerun_no_reset_not_in_tasks(self):
+        self.assertRaises(ValueError, self.client.liveactions.re_run, LIVE_ACTION['id'],
+                          tasks=['x'], no_reset=['y'])
+
     @mock.patch.object(
         models.ResourceManager, 'get_by_id',
         mock.MagicMock(return_vaue=models.LiveAction(**LIVE_ACTION)))
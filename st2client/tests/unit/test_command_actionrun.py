@@ -14,8 +14,11 @@
 # limitations under the License.
 
 from __future__ import absolute_import
+import os
 import copy
+import tempfile
 
+import six
 import unittest2
 import mock
 
@@ -207,3 +210,155 @@ class ActionRunCommandTest(unittest2.TestCase):
 
         # set auto_dict back to default
         mockarg.auto_dict = False
+
+    def _get_execution_result_with_polling(self):
+        """
+        Run _get_execution_result for an execution which is pending for 9 polls.
+        """
+        action = Action()
+        subparser = mock.Mock()
+        command = ActionRunCommand(action, self, subparser, name='test')
+
+        mockarg = mock.Mock()
+        mockarg.tail = False
+        mockarg.json = False
+        mockarg.yaml = False
+        setattr(mockarg, 'async', False)
+
+        statuses = ['scheduled'] + ['running'] * 8 + ['succeeded']
+        executions = [mock.Mock(id='123', status=status) for status in statuses]
+
+        action_exec_mgr = mock.Mock()
+        action_exec_mgr.get_by_id.side_effect = executions[1:]
+
+        execution = command._get_execution_result(execution=executions[0],
+                                                  action_exec_mgr=action_exec_mgr,
+                                                  args=mockarg)
+        return command, execution
+
+    @mock.patch('st2client.commands.action.time.sleep')
+    @mock.patch('st2client.commands.action.sys.stdout', mock.Mock())
+    def test_get_execution_result_poll_interval_backoff(self, mock_sleep):
+        command, execution = self._get_execution_result_with_polling()
+        self.assertEqual(execution.status, 'succeeded')
+
+        sleep_intervals = [call[0][0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(sleep_intervals), 9)
+        self.assertEqual(sleep_intervals[0], command.min_poll_interval)
+        self.assertEqual(sleep_intervals[-1], command.poll_interval)
+
+        for previous, current in zip(sleep_intervals, sleep_intervals[1:]):
+            self.assertTrue(current >= previous)
+
+    @mock.patch('st2client.commands.action.time.sleep', mock.Mock())
+    @mock.patch('st2client.commands.action.sys.stdout')
+    def test_get_execution_result_progress_flush(self, mock_stdout):
+        self._get_execution_result_with_polling()
+
+        # A dot is written on every poll, but short poll intervals are flushed together
+        written = [call[0][0] for call in mock_stdout.write.call_args_list]
+        self.assertEqual(written, ['.'] * 9 + ['\n'])
+
+        # Poll intervals are 0.1, 0.15, 0.225, 0.3375, 0.50625, 0.759375, 1.1390625, 1.70859375
+        # and 2 seconds which means stdout is flushed after the 5th, 7th, 8th and 9th poll
+        self.assertEqual(mock_stdout.flush.call_count, 4)
+
+        calls = [name for name, _, _ in mock_stdout.mock_calls]
+        self.assertEqual(calls.index('flush'), 5)
+
+    def test_split_parameters_args(self):
+        params, cmd = ActionRunCommand._split_parameters_args(parameters=[])
+        self.assertEqual(params, [])
+        self.assertEqual(cmd, None)
+
+        params, cmd = ActionRunCommand._split_parameters_args(parameters=[
+            'a=1', '@b=/tmp/file.txt', 'c=d=e'
+        ])
+        self.assertEqual(params, [('a', '1', False), ('b', '/tmp/file.txt', True),
+                                  ('c', 'd=e', False)])
+        self.assertEqual(cmd, None)
+
+        # Everything after the first positional argument is treated as positional
+        params, cmd = ActionRunCommand._split_parameters_args(parameters=[
+            'a=1', 'ls', '-la', 'b=2'
+        ])
+        self.assertEqual(params, [('a', '1', False)])
+        self.assertEqual(cmd, 'ls -la b=2')
+
+    def test_sort_parameters(self):
+        parameters = {
+            'a': {'type': 'string'},
+            'b': {'type': 'string', 'position': 1},
+            'c': {'type': 'string', 'position': 0},
+            'd': {'type': 'string'}
+        }
+
+        result = ActionRunCommand._sort_parameters(parameters=parameters,
+                                                   names=set(['d', 'a', 'b', 'c', 'e']))
+        self.assertEqual(result, ['e', 'c', 'b', 'a', 'd'])
+
+        result = ActionRunCommand._sort_parameters(parameters=parameters, names=[])
+        self.assertEqual(result, [])
+
+    def test_get_params_from_args_file_parameter(self):
+        runner = RunnerType()
+        runner.runner_parameters = {}
+
+        action = Action()
+        action.ref = 'test.action'
+        action.parameters = {
+            'param_file': {'type': 'string'},
+        }
+
+        subparser = mock.Mock()
+        command = ActionRunCommand(action, self, subparser, name='test')
+
+        mockarg = mock.Mock()
+        mockarg.inherit_env = False
+        mockarg.auto_dict = False
+
+        _, file_path = tempfile.mkstemp()
+        self.addCleanup(os.remove, file_path)
+
+        with open(file_path, 'wb') as fp:
+            fp.write(b'file content')
+
+        mockarg.parameters = ['@param_file=%s' % (file_path)]
+        param = command._get_action_parameters_from_args(action=action, runner=runner, args=mockarg)
+        self.assertEqual(param['param_file'], b'file content')
+
+        # File doesn't exist
+        mockarg.parameters = ['@param_file=%s.doesntexist' % (file_path)]
+        self.assertRaisesRegexp(ValueError, 'doesn\'t exist',
+                                command._get_action_parameters_from_args,
+                                action=action, runner=runner, args=mockarg)
+
+        # Not a file
+        mockarg.parameters = ['@param_file=%s' % (os.path.dirname(file_path))]
+        self.assertRaisesRegexp(ValueError, 'is not a file',
+                                command._get_action_parameters_from_args,
+                                action=action, runner=runner, args=mockarg)
+
+    @mock.patch('sys.stdout', new_callable=six.StringIO)
+    def test_print_param(self, mock_stdout):
+        schema = {
+            'description': 'Some param.',
+            'type': 'string',
+            'enum': ['a', 'b'],
+            'default': 'a'
+        }
+
+        # Wrappers are shared so printing multiple params should result in the same output
+        ActionRunCommand._print_param('param1', schema)
+        ActionRunCommand._print_param('param1', schema)
+
+        expected = ('    param1\n'
+                    '        Some param.\n'
+                    '        Type: string\n'
+                    '        Enum: a, b\n'
+                    '        Default: a\n'
+                    '\n')
+        self.assertEqual(mock_stdout.getvalue(), expected * 2)
+
+        self.assertRaisesRegexp(ValueError, 'Missing schema for parameter "param2"',
+                                ActionRunCommand._print_param, 'param2', None)
@@ -23,6 +23,8 @@ import tempfile
 import unittest2
 from collections import namedtuple
 
+from six.moves import urllib
+
 from tests import base
 from tests.base import BaseCLITestCase
 
@@ -31,6 +33,7 @@ from st2client import models
 from st2client.utils import httpclient
 from st2client.commands import resource
 from st2client.commands.action import ActionExecutionReadCommand
+from st2client.commands.action import ActionExecutionListCommand
 
 __all__ = [
     'TestResourceCommand',
@@ -276,6 +279,68 @@ class ActionExecutionReadCommandTestCase(unittest2.TestCase):
         self.assertEqual(result, [])
 
 
+class ActionExecutionListCommandTestCase(BaseCLITestCase):
+
+    capture_output = True
+
+    def __init__(self, *args, **kwargs):
+        super(ActionExecutionListCommandTestCase, self).__init__(*args, **kwargs)
+        self.shell = Shell()
+
+    def _get_query_params(self):
+        url = httpclient.HTTPClient.get.call_args[0][0]
+        query = urllib.parse.urlparse(url).query
+        return dict(urllib.parse.parse_qsl(query))
+
+    @mock.patch.object(
+        httpclient.HTTPClient, 'get',
+        mock.MagicMock(return_value=base.FakeResponse(json.dumps([]), 200, 'OK', {})))
+    def test_list_computed_attribute(self):
+        self.assertEqual(self.shell.run(['execution', 'list', '-a', 'elapsed_seconds']), 0)
+
+        params = self._get_query_params()
+        self.assertEqual(params['include_attributes'],
+                         'start_timestamp,end_timestamp,status,children')
+        self.assertFalse('exclude_attributes' in params)
+
+    @mock.patch.object(
+        httpclient.HTTPClient, 'get',
+        mock.MagicMock(return_value=base.FakeResponse(json.dumps([]), 200, 'OK', {})))
+    def test_list_unknown_attribute(self):
+        self.assertEqual(self.shell.run(['execution', 'list', '-a', 'id', 'doesntexist']), 0)
+
+        params = self._get_query_params()
+        self.assertEqual(params['exclude_attributes'], 'result,trigger_instance')
+        self.assertFalse('include_attributes' in params)
+
+    def test_get_include_attributes(self):
+        cls = namedtuple('Args', 'attr')
+
+        args = cls(attr=ActionExecutionListCommand.display_attributes)
+        result = ActionExecutionListCommand._get_include_attributes(args=args)
+        self.assertEqual(result, ['id', 'action', 'context', 'status', 'start_timestamp',
+                                  'end_timestamp', 'children'])
+
+        args = cls(attr=['result.stdout', 'result.stderr'])
+        result = ActionExecutionListCommand._get_include_attributes(args=args)
+        self.assertEqual(result, ['result', 'status', 'start_timestamp', 'end_timestamp',
+                                  'children'])
+
+        args = cls(attr=['id', 'elapsed_seconds'])
+        result = ActionExecutionListCommand._get_include_attributes(args=args)
+        self.assertEqual(result, ['id', 'start_timestamp', 'end_timestamp', 'status',
+                                  'children'])
+
+        # All the attributes are retrieved for unknown attributes
+        args = cls(attr=['id', 'doesntexist'])
+        result = ActionExecutionListCommand._get_include_attributes(args=args)
+        self.assertEqual(result, None)
+
+        args = cls(attr=['all'])
+        result = ActionExecutionListCommand._get_include_attributes(args=args)
+        self.assertEqual(result, None)
+
+
 class CommandsHelpStringTestCase(BaseCLITestCase):
     """
     Test case which verifies that all the commands support -h / --help flag.
@@ -31,6 +31,7 @@ from tests.fixtures import loader
 
 from st2client import shell
 from st2client.formatters import table
+from st2client.formatters.execution import ExecutionResult
 from st2client.utils import jsutil
 from st2client.utils import httpclient
 from st2client.utils import color
@@ -220,6 +221,24 @@ class TestExecutionResultFormatter(unittest2.TestCase):
         self.assertEqual(
             content, FIXTURES['results']['execution_list_empty_response_start_timestamp_attr.txt'])
 
+    def test_parse_structured_value(self):
+        parse = ExecutionResult._parse_structured_value
+
+        self.assertEqual(parse("{'a': 1, 'b': [1, 2]}"), {'a': 1, 'b': [1, 2]})
+        self.assertEqual(parse('{"a": true, "b": null}'), {'a': True, 'b': None})
+        self.assertEqual(parse('[1, 2, 3]'), [1, 2, 3])
+
+        # Values which can't be parsed are returned as is
+        self.assertEqual(parse('{not valid}'), '{not valid}')
+        self.assertEqual(parse('[foo bar]'), '[foo bar]')
+
+        # Unhashable dictionary key
+        self.assertEqual(parse('{[1]: 2}'), '{[1]: 2}')
+
+        # Very deeply nested value
+        value = '[' * 100000 + ']' * 100000
+        self.assertEqual(parse(value), value)
+
     @mock.patch.object(
         httpclient.HTTPClient, 'get',
         mock.MagicMock(return_value=base.FakeResponse(json.dumps(EXECUTION), 200, 'OK', {})))
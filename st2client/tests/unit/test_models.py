@@ -39,6 +39,20 @@ class TestSerialization(unittest2.TestCase):
         self.assertEqual(instance.id, '123')
         self.assertEqual(instance.name, 'abc')
 
+    def test_resource_init(self):
+        instance = base.FakeResource(id='123', name='abc', tags=[])
+        self.assertEqual(instance.id, '123')
+        self.assertEqual(instance.name, 'abc')
+        self.assertEqual(instance.tags, [])
+        self.assertDictEqual(vars(instance), {'id': '123', 'name': 'abc', 'tags': []})
+
+    def test_keyvalue_pair_init_sets_id_property(self):
+        # Note: "id" is a property which is an alias for "name"
+        instance = models.KeyValuePair(id='key1', value='value1')
+        self.assertEqual(instance.id, 'key1')
+        self.assertEqual(instance.name, 'key1')
+        self.assertDictEqual(instance.serialize(), {'name': 'key1', 'value': 'value1'})
+
 
 class TestResourceManager(unittest2.TestCase):
 
@@ -24,6 +24,7 @@ from st2common import log as logging
 from st2common.constants.meta import ALLOWED_EXTS
 from st2common.bootstrap.base import ResourceRegistrar
 from st2common.persistence.action import Action
+from st2common.persistence.runner import RunnerType
 from st2common.models.api.action import ActionAPI
 from st2common.models.system.common import ResourceReference
 import st2common.content.utils as content_utils
@@ -116,7 +117,15 @@ class ActionsRegistrar(ResourceRegistrar):
 
         return actions
 
-    def _register_action(self, pack, action):
+    def _register_action(self, pack, action, runner_types_db=None):
+        """
+        :param runner_types_db: Optional dictionary which maps runner type name to the
+                                RunnerTypeDB object. If the runner used by the action is not
+                                available in this dictionary, it's retrieved from the database.
+        :type runner_types_db: ``dict``
+        """
+        runner_types_db = runner_types_db or {}
+
         content = self._meta_loader.load(action)
         pack_field = content.get('pack', None)
         if not pack_field:
@@ -150,7 +159,8 @@ class ActionsRegistrar(ResourceRegistrar):
                 raise jsonschema.ValidationError(new_msg)
             raise e
 
-        action_validator.validate_action(action_api)
+        runner_type_db = runner_types_db.get(action_api.runner_type, None)
+        action_validator.validate_action(action_api, runner_type_db=runner_type_db)
         model = ActionAPI.to_model(action_api)
 
         action_ref = ResourceReference.to_string_reference(pack=pack, name=str(content['name']))
@@ -173,10 +183,14 @@ class ActionsRegistrar(ResourceRegistrar):
     def _register_actions_from_pack(self, pack, actions):
         registered_count = 0
 
+        # Retrieve all the runner types using a single query instead of performing a runner
+        # lookup for each registered action
+        runner_types_db = self._get_runner_types_by_name()
+
         for action in actions:
             try:
                 LOG.debug('Loading action from %s.', action)
-                self._register_action(pack, action)
+                self._register_action(pack, action, runner_types_db=runner_types_db)
             except Exception as e:
                 if self._fail_on_failure:
                     msg = ('Failed to register action "%s" from pack "%s": %s' % (action, pack,
@@ -190,6 +204,16 @@ class ActionsRegistrar(ResourceRegistrar):
 
         return registered_count
 
+    def _get_runner_types_by_name(self):
+        """
+        Return a dictionary which maps runner type name to the RunnerTypeDB object.
+
+        :rtype: ``dict``
+        """
+        runner_types_db = RunnerType.get_all()
+        result = {runner_type_db.name: runner_type_db for runner_type_db in runner_types_db}
+        return result
+
 
 def register_actions(packs_base_paths=None, pack_dir=None, use_pack_cache=True,
                      fail_on_failure=False):
@@ -67,7 +67,7 @@ def purge_executions(logger, timestamp, action_ref=None, purge_incomplete=False)
         filters['start_timestamp__lt'] = timestamp
         filters['status'] = {'$in': DONE_STATES}
 
-    exec_filters = copy.copy(filters)
+    exec_filters = filters.copy()
     if action_ref:
         exec_filters['action__ref'] = action_ref
 
@@ -97,7 +97,7 @@ class ErrorHandlingMiddleware(object):
 
             body['faultstring'] = message
 
-            response_body = json_encode(body)
+            response_body = json_encode(body, indent=None)
             headers = {
                 'Content-Type': 'application/json',
                 'Content-Length': str(len(response_body))
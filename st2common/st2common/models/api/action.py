@@ -18,6 +18,7 @@ import copy
 
 from st2common.util import isotime
 from st2common.util import schema as util_schema
+from st2common.util import mongoescape as util_mongodb
 from st2common import log as logging
 from st2common.constants.pack import DEFAULT_PACK_NAME
 from st2common.models.api.base import BaseAPI
@@ -226,8 +227,8 @@ class ActionAPI(BaseAPI, APIUIDMixin):
     }
 
     def __init__(self, **kw):
-        for key, value in kw.items():
-            setattr(self, key, value)
+        super(ActionAPI, self).__init__(**kw)
+
         if not hasattr(self, 'parameters'):
             setattr(self, 'parameters', dict())
         if not hasattr(self, 'entry_point'):
@@ -236,11 +237,53 @@ class ActionAPI(BaseAPI, APIUIDMixin):
     @classmethod
     def from_model(cls, model, mask_secrets=False):
         action = cls._from_model(model)
-        action['runner_type'] = action['runner_type']['name']
-        action['tags'] = TagsHelper.from_model(model.tags)
 
-        if getattr(model, 'notify', None):
-            action['notify'] = NotificationsHelper.from_model(model.notify)
+        notify = getattr(model, 'notify', None)
+        if notify:
+            notify = NotificationsHelper.from_model(notify)
+
+        return cls._from_doc(action=action, notify=notify)
+
+    @classmethod
+    def from_dict(cls, doc):
+        """
+        Create API model class instance for the provided raw MongoDB document.
+
+        This is a faster alternative to "from_model" which is used when retrieving a lot of
+        actions since it doesn't require a mongoengine document to be instantiated.
+
+        :param doc: Raw MongoDB document (e.g. as returned by "QuerySet.as_pymongo").
+        :type doc: ``dict``
+        """
+        notify = doc.get('notify', None)
+        if notify:
+            notify = NotificationsHelper.from_dict(notify)
+
+        action = util_mongodb.unescape_chars(doc)
+
+        if '_id' in action:
+            action['id'] = str(action.pop('_id'))
+
+        return cls._from_doc(action=action, notify=notify)
+
+    @classmethod
+    def _from_doc(cls, action, notify=None):
+        """
+        Create API model class instance from the unescaped document. Used by "from_model" and
+        "from_dict".
+
+        :param notify: Notify attribute which has already been converted to the API format.
+        :type notify: ``dict``
+        """
+        if 'runner_type' in action:
+            action['runner_type'] = action['runner_type']['name']
+
+        # Note: Tags are stored as a list of {"name": ..., "value": ...} documents
+        action['tags'] = [{'name': tag.get('name', None), 'value': tag.get('value', None)}
+                          for tag in action.get('tags', [])]
+
+        if notify:
+            action['notify'] = notify
 
         return cls(**action)
 
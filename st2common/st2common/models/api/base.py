@@ -37,8 +37,8 @@ class BaseAPI(object):
     schema = abc.abstractproperty
 
     def __init__(self, **kw):
-        for key, value in kw.items():
-            setattr(self, key, value)
+        # Note: Updating __dict__ directly is faster than calling setattr for each attribute
+        self.__dict__.update(kw)
 
     def __repr__(self):
         name = type(self).__name__
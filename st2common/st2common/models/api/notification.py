@@ -89,6 +89,13 @@ class NotificationsHelper(object):
 
         return notify
 
+    @staticmethod
+    def from_dict(notify_dict):
+        """
+        Same as "from_model", but for a raw (escaped) MongoDB notification document.
+        """
+        return NotificationsHelper.from_model(NotificationSchema(**notify_dict))
+
     @staticmethod
     def _from_model_sub_schema(notify_sub_schema_model):
         notify_sub_schema = {}
@@ -322,7 +322,10 @@ class MongoDBAccess(object):
                 msg = ('Invalid or unsupported include attribute specified: %s' % str(e))
                 raise ValueError(msg)
 
-        instance = instances[0] if instances else None
+        # Note: We use first() instead of "instances[0] if instances else None". Evaluating
+        # queryset in a boolean context performs an additional query so that approach results in
+        # two round trips to the database when the object exists.
+        instance = instances.first()
         log_query_and_profile_data_for_queryset(queryset=instances)
 
         if not instance and raise_exception:
@@ -352,6 +355,7 @@ class MongoDBAccess(object):
         exclude_fields = filters.pop('exclude_fields', None)
         only_fields = filters.pop('only_fields', None)
         no_dereference = filters.pop('no_dereference', None)
+        as_pymongo = filters.pop('as_pymongo', None)
 
         order_by = order_by or []
         exclude_fields = exclude_fields or []
@@ -379,6 +383,11 @@ class MongoDBAccess(object):
         if no_dereference:
             result = result.no_dereference()
 
+        if as_pymongo:
+            # Return raw pymongo documents instead of mongoengine model instances. This avoids
+            # the (expensive) model instantiation when retrieving a lot of objects.
+            result = result.as_pymongo()
+
         result = result.order_by(*order_by)
         result = result[offset:eop]
         log_query_and_profile_data_for_queryset(queryset=result)
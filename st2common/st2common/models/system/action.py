@@ -145,7 +145,7 @@ class ShellCommandAction(object):
 
     def _get_env_vars_export_string(self):
         if self.env_vars:
-            env_vars = copy.copy(self.env_vars)
+            env_vars = self.env_vars.copy()
 
             # If sudo_password is provided, explicitly disable bash history to make sure password
             # is not logged, because password is provided via command line
@@ -125,7 +125,10 @@ class Response(webob.Response):
                 json_body = kwargs.pop('json_body')
             else:
                 json_body = kwargs.pop('json')
-            body = json_encode(json_body).encode('UTF-8')
+            # Note: Response body is not indented since the C JSON encoder is only used when
+            # indent is not specified and that makes a big difference for large responses (e.g.
+            # GET /v1/actions, GET /v1/executions)
+            body = json_encode(json_body, indent=None).encode('UTF-8')
 
             if content_type is None:
                 content_type = 'application/json'
@@ -137,7 +140,7 @@ class Response(webob.Response):
         return super(Response, self)._json_body__get()
 
     def _json_body__set(self, value):
-        self.body = json_encode(value).encode('UTF-8')
+        self.body = json_encode(value, indent=None).encode('UTF-8')
 
     def _json_body__del(self):
         return super(Response, self)._json_body__del()
@@ -229,7 +232,7 @@ class Router(object):
         LOG.debug("Parsed endpoint: %s", endpoint)
         LOG.debug("Parsed path_vars: %s", path_vars)
 
-        context = copy.copy(getattr(self, 'mock_context', {}))
+        context = getattr(self, 'mock_context', {}).copy()
         cookie_token = None
 
         # Handle security
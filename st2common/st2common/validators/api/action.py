@@ -14,6 +14,8 @@
 # limitations under the License.
 
 from __future__ import absolute_import
+import time
+
 import six
 
 from st2common.exceptions.apivalidation import ValueValidationException
@@ -29,9 +31,25 @@ from six.moves import range
 
 LOG = logging.getLogger(__name__)
 
+# Maps (packs base paths, pack name) to the timestamp until which a successful pack actions
+# directory check is cached
+VALID_PACKS_CACHE = {}
+
+# How long (in seconds) to cache a successful pack actions directory check for
+VALID_PACKS_CACHE_TTL = 30
+
+# Maximum number of entries in the cache. After expired entries have been removed, the whole
+# cache is cleared if it's still larger
+VALID_PACKS_CACHE_MAX_SIZE = 1000
+
 
-def validate_action(action_api):
-    runner_db = _get_runner_model(action_api)
+def validate_action(action_api, runner_type_db=None):
+    """
+    :param runner_type_db: RunnerTypeDB object for the action runner. If not provided, it's
+                           retrieved from the database.
+    :type runner_type_db: :class:`RunnerTypeDB`
+    """
+    runner_db = runner_type_db or _get_runner_model(action_api)
 
     # Check if pack is valid.
     if not _is_valid_pack(action_api.pack):
@@ -59,7 +77,40 @@ def _get_runner_model(action_api):
 
 
 def _is_valid_pack(pack):
-    return check_pack_content_directory_exists(pack=pack, content_type='actions')
+    # Note: Pack directories very rarely change so we cache a successful check for a short
+    # amount of time to avoid hitting the filesystem on each action create / update request.
+    # Failed checks are not cached so a newly created pack is picked up right away.
+    cache_key = (tuple(get_packs_base_paths()), pack)
+    now = time.time()
+
+    if VALID_PACKS_CACHE.get(cache_key, 0) > now:
+        return True
+
+    is_valid = check_pack_content_directory_exists(pack=pack, content_type='actions')
+
+    if is_valid:
+        if len(VALID_PACKS_CACHE) >= VALID_PACKS_CACHE_MAX_SIZE:
+            _remove_expired_valid_packs_cache_entries(now=now)
+
+        VALID_PACKS_CACHE[cache_key] = now + VALID_PACKS_CACHE_TTL
+
+    return is_valid
+
+
+def clear_valid_packs_cache():
+    """
+    Clear the cache of successful pack actions directory checks.
+    """
+    VALID_PACKS_CACHE.clear()
+
+
+def _remove_expired_valid_packs_cache_entries(now):
+    for cache_key, expire_timestamp in list(VALID_PACKS_CACHE.items()):
+        if expire_timestamp <= now:
+            del VALID_PACKS_CACHE[cache_key]
+
+    if len(VALID_PACKS_CACHE) >= VALID_PACKS_CACHE_MAX_SIZE:
+        clear_valid_packs_cache()
 
 
 def _validate_parameters(action_ref, action_params=None, runner_params=None):
@@ -0,0 +1,80 @@
+# Licensed to the StackStorm, Inc ('StackStorm') under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+from st2tests import DbTestCase
+from st2common.models.api.action import ActionAPI
+from st2common.persistence.action import Action
+
+ACTION = {
+    'name': 'action1',
+    'description': 'test description',
+    'enabled': True,
+    'pack': 'wolfpack',
+    'entry_point': '/tmp/test/action1.sh',
+    'runner_type': 'local-shell-script',
+    'parameters': {
+        'a': {'type': 'string', 'default': 'A1'},
+        'b.c': {'type': 'string', 'default': 'B1'}
+    },
+    'tags': [
+        {'name': 'tag1', 'value': 'dont-care'}
+    ],
+    'notify': {
+        'on-complete': {
+            'message': 'Action completed.',
+            'routes': ['66'],
+            'data': {'foo': '{{foo}}', 'bar.baz': 'escaped'}
+        }
+    }
+}
+
+
+class ActionAPIModelTestCase(DbTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(ActionAPIModelTestCase, cls).setUpClass()
+        cls.action_db = Action.add_or_update(ActionAPI.to_model(ActionAPI(**ACTION)))
+
+    def test_from_dict_matches_from_model(self):
+        action_db = Action.query(id=self.action_db.id).first()
+        # Raw document as returned by QuerySet.as_pymongo()
+        doc = Action.query(id=self.action_db.id, as_pymongo=True).first()
+
+        action_api_from_model = ActionAPI.from_model(action_db)
+        action_api_from_dict = ActionAPI.from_dict(doc)
+
+        self.assertEqual(vars(action_api_from_dict), vars(action_api_from_model))
+        self.assertEqual(action_api_from_dict.id, str(self.action_db.id))
+        self.assertEqual(action_api_from_dict.runner_type, 'local-shell-script')
+        self.assertEqual(action_api_from_dict.parameters, ACTION['parameters'])
+        self.assertEqual(action_api_from_dict.notify, ACTION['notify'])
+
+    def test_from_dict_exclude_fields_matches_from_model(self):
+        # E.g. ?exclude_attributes=parameters,notify filter
+        exclude_fields = ['parameters', 'notify']
+        action_db = Action.query(id=self.action_db.id, exclude_fields=exclude_fields).first()
+        doc = Action.query(id=self.action_db.id, exclude_fields=exclude_fields,
+                           as_pymongo=True).first()
+
+        action_api_from_model = ActionAPI.from_model(action_db)
+        action_api_from_dict = ActionAPI.from_dict(doc)
+
+        self.assertEqual(vars(action_api_from_dict), vars(action_api_from_model))
+        self.assertEqual(action_api_from_dict.id, str(self.action_db.id))
+        self.assertEqual(action_api_from_dict.runner_type, 'local-shell-script')
+        self.assertFalse(hasattr(action_api_from_dict, 'notify'))
@@ -41,6 +41,10 @@ class TestActionAPIValidator(DbTestCase):
 
         RunnerType.add_or_update(runner_model)
 
+    def setUp(self):
+        super(TestActionAPIValidator, self).setUp()
+        action_validator.clear_valid_packs_cache()
+
     @mock.patch.object(action_validator, '_is_valid_pack', mock.MagicMock(
         return_value=True))
     def test_validate_runner_type_happy_case(self):
@@ -123,3 +127,52 @@ class TestActionAPIValidator(DbTestCase):
                       'because position values are not contiguous.' % json.dumps(action_api_dict))
         except ValueValidationException as e:
             self.assertTrue('are not contiguous' in str(e))
+
+    @mock.patch.object(action_validator.time, 'time', mock.Mock(return_value=1000))
+    @mock.patch.object(action_validator, 'check_pack_content_directory_exists')
+    def test_is_valid_pack_successful_check_is_cached(self, mock_check_pack_exists):
+        # Failed check is not cached
+        mock_check_pack_exists.return_value = False
+        self.assertFalse(action_validator._is_valid_pack('dummy_pack_1'))
+        self.assertFalse(action_validator._is_valid_pack('dummy_pack_1'))
+        self.assertEqual(mock_check_pack_exists.call_count, 2)
+
+        # Successful check is cached
+        mock_check_pack_exists.return_value = True
+        self.assertTrue(action_validator._is_valid_pack('dummy_pack_1'))
+        self.assertTrue(action_validator._is_valid_pack('dummy_pack_1'))
+        self.assertEqual(mock_check_pack_exists.call_count, 3)
+
+        # Cached value is still valid right before the TTL
+        action_validator.time.time.return_value = 1000 + action_validator.VALID_PACKS_CACHE_TTL - 1
+        self.assertTrue(action_validator._is_valid_pack('dummy_pack_1'))
+        self.assertEqual(mock_check_pack_exists.call_count, 3)
+
+        # Cached value has expired
+        action_validator.time.time.return_value = 1000 + action_validator.VALID_PACKS_CACHE_TTL
+        self.assertTrue(action_validator._is_valid_pack('dummy_pack_1'))
+        self.assertEqual(mock_check_pack_exists.call_count, 4)
+
+    @mock.patch.object(action_validator, 'VALID_PACKS_CACHE_MAX_SIZE', 2)
+    @mock.patch.object(action_validator.time, 'time', mock.Mock(return_value=1000))
+    @mock.patch.object(action_validator, 'check_pack_content_directory_exists',
+                       mock.Mock(return_value=True))
+    def test_is_valid_pack_cache_size_is_limited(self):
+        action_validator._is_valid_pack('dummy_pack_1')
+        action_validator.time.time.return_value = 1000 + action_validator.VALID_PACKS_CACHE_TTL
+        action_validator._is_valid_pack('dummy_pack_2')
+        self.assertEqual(len(action_validator.VALID_PACKS_CACHE), 2)
+
+        # Expired entry is removed
+        action_validator._is_valid_pack('dummy_pack_3')
+        self.assertEqual(len(action_validator.VALID_PACKS_CACHE), 2)
+        self.assertEqual(sorted([pack for _, pack in action_validator.VALID_PACKS_CACHE]),
+                         ['dummy_pack_2', 'dummy_pack_3'])
+
+        # Cache is cleared when there are no expired entries
+        action_validator._is_valid_pack('dummy_pack_4')
+        self.assertEqual([pack for _, pack in action_validator.VALID_PACKS_CACHE],
+                         ['dummy_pack_4'])
+
+        action_validator.clear_valid_packs_cache()
+        self.assertEqual(action_validator.VALID_PACKS_CACHE, {})
@@ -14,8 +14,12 @@
 # limitations under the License.
 
 from __future__ import absolute_import
+import importlib
+import pkgutil
+
 import unittest2
 
+import st2common.models.api
 from st2common.models.api.base import BaseAPI
 
 __all__ = [
@@ -211,3 +215,28 @@ class APIModelValidationTestCase(unittest2.TestCase):
         self.assertEqual(mock_model_api_validated.permission_grants,
                          [{'description': 'test', 'resource_uid': None}])
         self.assertEqual(mock_model_api_validated.parameters, {'id': None, 'name': 'test'})
+
+    def test_constructor_sets_attributes(self):
+        mock_model_api = MockAPIModel1(name='name1', enabled=False, parameters={'a': 1})
+        self.assertEqual(vars(mock_model_api),
+                         {'name': 'name1', 'enabled': False, 'parameters': {'a': 1}})
+        self.assertEqual(mock_model_api.name, 'name1')
+        self.assertEqual(mock_model_api.enabled, False)
+        self.assertEqual(mock_model_api.parameters, {'a': 1})
+
+    def test_api_models_dont_define_properties(self):
+        # BaseAPI constructor updates instance __dict__ directly which bypasses properties and
+        # __setattr__ so API models can't rely on those
+        for _, module_name, _ in pkgutil.iter_modules(st2common.models.api.__path__):
+            importlib.import_module('st2common.models.api.%s' % (module_name))
+
+        classes = BaseAPI.__subclasses__()
+        while classes:
+            cls = classes.pop()
+            classes.extend(cls.__subclasses__())
+
+            self.assertTrue(cls.__setattr__ is object.__setattr__, cls)
+
+            for base_cls in cls.__mro__:
+                for name, value in base_cls.__dict__.items():
+                    self.assertFalse(isinstance(value, property), '%s.%s' % (cls, name))
@@ -35,3 +35,11 @@ class JsonifyTests(unittest2.TestCase):
         d = '{"a": 1, "b": true}'
         expected = {'a': 1, 'b': True}
         self.assertDictEqual(jsonify.try_loads(d), expected)
+
+    def test_json_encode(self):
+        class Model(object):
+            def __json__(self):
+                return {'b': 1}
+
+        self.assertEqual(jsonify.json_encode({'a': Model()}, indent=None), '{"a": {"b": 1}}')
+        self.assertEqual(jsonify.json_encode([Model()], indent=None), '[{"b": 1}]')
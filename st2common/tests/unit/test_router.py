@@ -0,0 +1,42 @@
+# Licensed to the StackStorm, Inc ('StackStorm') under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import unittest2
+import webob
+
+from st2common.middleware.error_handling import ErrorHandlingMiddleware
+from st2common.router import Response
+
+
+class RouterResponseTestCase(unittest2.TestCase):
+
+    def test_json_body_is_not_indented(self):
+        resp = Response(json={'a': [1, 2], 'b': {'c': None}})
+        self.assertEqual(resp.content_type, 'application/json')
+        self.assertNotIn(b'\n', resp.body)
+        self.assertEqual(resp.json, {'a': [1, 2], 'b': {'c': None}})
+
+        resp.json = [{'d': True}]
+        self.assertEqual(resp.body, b'[{"d": true}]')
+
+    def test_error_body_is_not_indented(self):
+        def app(environ, start_response):
+            raise ValueError('some error')
+
+        resp = webob.Request.blank('/').get_response(ErrorHandlingMiddleware(app))
+        self.assertEqual(resp.status_int, 400)
+        self.assertEqual(resp.body, b'{"faultstring": "some error"}')
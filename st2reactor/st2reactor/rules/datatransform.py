@@ -14,7 +14,6 @@
 # limitations under the License.
 
 from __future__ import absolute_import
-import copy
 
 from st2common.constants.keyvalue import SYSTEM_SCOPE, FULL_SYSTEM_SCOPE, DATASTORE_PARENT_SCOPE
 from st2common.constants.rules import TRIGGER_PAYLOAD_PREFIX
@@ -28,7 +27,7 @@ class Jinja2BasedTransformer(object):
             _construct_context(TRIGGER_PAYLOAD_PREFIX, payload, {})
 
     def __call__(self, mapping):
-        context = copy.copy(self._payload_context)
+        context = self._payload_context.copy()
         context.update({
             DATASTORE_PARENT_SCOPE: {
                 SYSTEM_SCOPE: KeyValueLookup(scope=FULL_SYSTEM_SCOPE)